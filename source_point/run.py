@@ -3,11 +3,59 @@
 #
 
 
+import logging
 import sys
+import threading
+from typing import List
 
-from airbyte_cdk.entrypoint import launch
+from airbyte_cdk.entrypoint import AirbyteEntrypoint
 from source_point import SourcePoint
 
+# Number of serialized messages written to stdout per write/flush
+MESSAGE_BATCH_SIZE = 1000
+
+
+def launch(source: SourcePoint, args: List[str]) -> None:
+    """
+    Run the connector like airbyte_cdk.entrypoint.launch, but write messages in batches.
+
+    The CDK's launch flushes stdout once per message, which costs a write syscall per
+    record. Messages are still emitted one per line; they are only buffered until
+    MESSAGE_BATCH_SIZE of them are ready or the command finishes. The CDK's log handlers
+    write LOG messages straight to stdout, so the buffered messages are written out
+    before each log record to keep the output in order.
+    """
+    source_entrypoint = AirbyteEntrypoint(source)
+    parsed_args = source_entrypoint.parse_args(args)
+    batch: List[str] = []
+    # Log records may be emitted from other threads than the one filling the batch
+    lock = threading.Lock()
+
+    def flush() -> None:
+        with lock:
+            if batch:
+                sys.stdout.write("\n".join(batch) + "\n")
+                batch.clear()
+            sys.stdout.flush()
+
+    def flush_before_log(record: logging.LogRecord) -> bool:
+        flush()
+        return True
+
+    handlers = list(logging.getLogger().handlers)
+    for handler in handlers:
+        handler.addFilter(flush_before_log)
+    try:
+        for message in source_entrypoint.run(parsed_args):
+            with lock:
+                batch.append(message)
+            if len(batch) >= MESSAGE_BATCH_SIZE:
+                flush()
+    finally:
+        for handler in handlers:
+            handler.removeFilter(flush_before_log)
+        flush()
+
 
 def run():
     source = SourcePoint()
@@ -15,4 +63,4 @@ def run():
 
 
 if __name__ == "__main__":
-    run()
\ No newline at end of file
+    run()
@@ -2,17 +2,39 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-import base64
+import binascii
+import codecs
 import csv
-import io
-import json
+import functools
 import logging
 import os
-from typing import Any, Iterable, List, Mapping, Optional
+import re
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
 
+import orjson
 import requests
 from airbyte_cdk.sources.streams.http import HttpStream
 
+try:
+    # SIMD (SSSE3/AVX2/AVX-512) decoder; produces the same bytes as the stdlib
+    from pybase64 import b64decode
+except ImportError:
+    from base64 import b64decode
+
+# Start of the "Data" string value and the ContentType value in the raw JSON body
+_DATA_VALUE_START = re.compile(rb'"Data"\s*:\s*"')
+_CONTENT_TYPE_VALUE = re.compile(rb'"ContentType"\s*:\s*"([^"]*)"')
+
+# Line breaks and other whitespace that wrapped base64 (e.g. MIME-style, 76 per line) may contain
+_BASE64_WHITESPACE = re.compile(r"\s+")
+
+# Lowercase spellings accepted for boolean columns
+_TRUE = frozenset(("true", "yes", "1", "on", "enabled"))
+_FALSE = frozenset(("false", "no", "0", "off", "disabled"))
+
 
 class PointStream(HttpStream):
     """
@@ -23,6 +45,12 @@ class PointStream(HttpStream):
     """
 
     url_base = "https://webservices.verzorgdeoverdracht.nl/api/DistributableData/"
+    # Number of base64 characters decoded per step; a multiple of 4 so every slice decodes on its own
+    decode_chunk_size = 1 << 16
+    # Number of bytes read from the socket per step when downloading the response body
+    read_chunk_size = 1 << 20
+    # Seconds a schema discovered from the API is reused from the temp directory
+    schema_cache_ttl = 24 * 60 * 60
     primary_key = "TransferID"  # Use TransferID as primary key
     cursor_field = "TransferCreatedDate"  # Use TransferCreatedDate as cursor field
     http_method = "GET"
@@ -32,6 +60,9 @@ class PointStream(HttpStream):
         self.api_key = config["api_key"]
         self.organization_id = config["organization_id"]
         self.distribution_type_id = config.get("distribution_type_id", "1")
+        self._cached_schema: Optional[Mapping[str, Any]] = None
+        # (field, type) pairs that already logged a conversion failure
+        self._conversion_warnings: Set[Tuple[str, str]] = set()
 
     @property
     def name(self) -> str:
@@ -57,6 +88,9 @@ class PointStream(HttpStream):
     ) -> Mapping[str, str]:
         """
         Return headers for the API request.
+        
+        Accept-Encoding is left to the session, whose default already lists every encoding
+        urllib3 can decode; the brotli dependency is what adds br to it.
         """
         return {
             "APIkey": self.api_key,
@@ -79,6 +113,19 @@ class PointStream(HttpStream):
             # Removed APIkey from query params - using header only for better security
         }
 
+    def request_kwargs(
+        self,
+        stream_state: Optional[Mapping[str, Any]],
+        stream_slice: Optional[Mapping[str, Any]] = None,
+        next_page_token: Optional[Mapping[str, Any]] = None,
+    ) -> Mapping[str, Any]:
+        """
+        Return keyword arguments for sending the request.
+        
+        The body is streamed so _read_response_body can download it in read_chunk_size chunks.
+        """
+        return {"stream": True}
+
     def next_page_token(
         self,
         response: requests.Response,
@@ -138,100 +185,144 @@ class PointStream(HttpStream):
         We decode the CSV and yield each row as a record.
         """
         try:
-            json_response = response.json()
+            json_response = orjson.loads(self._read_response_body(response))
             
-            # Extract metadata from the response (direct structure, no 'body' wrapper)
+            # Extract metadata from the response (direct structure, no 'body' wrapper);
+            # every record starts as a copy of these top-level metadata fields
             metadata = {
                 "_metadata_identifier": json_response.get("Identifier"),
-                "_metadata_file_name": json_response.get("FileName"),
-                "_metadata_timestamp": json_response.get("Timestamp")
+                "_metadata_timestamp": json_response.get("Timestamp"),
+                "_metadata_file_name": json_response.get("FileName")
             }
             
             # Decode base64 data
             if "Data" not in json_response:
                 logging.error(f"No 'Data' field found in API response. Available fields: {list(json_response.keys()) if isinstance(json_response, dict) else type(json_response)}")
                 return
-                
-            try:
-                # Decode base64 data with proper encoding handling
-                csv_bytes = base64.b64decode(json_response["Data"])
-                
-                # Try different encodings commonly used for CSV files
-                encodings = ['utf-8', 'windows-1252', 'iso-8859-1', 'cp1252']
-                csv_data = None
-                
-                for encoding in encodings:
-                    try:
-                        csv_data = csv_bytes.decode(encoding)
-                        logging.info(f"Successfully decoded base64 data using {encoding}, length: {len(csv_data)}")
-                        break
-                    except UnicodeDecodeError:
-                        continue
-                
-                if csv_data is None:
-                    logging.error("Could not decode CSV data with any supported encoding")
-                    return
-                    
-            except Exception as e:
-                logging.error(f"Failed to decode base64 data: {str(e)}")
+            if not isinstance(json_response["Data"], str):
+                logging.error(f"'Data' field in API response is not a base64 string: {type(json_response['Data']).__name__}")
                 return
             
-            # Parse CSV data
-            # Handle CSV with potential sep= header
-            csv_lines = csv_data.strip().split('\n')
-            if csv_lines and csv_lines[0].startswith('sep='):
-                # Skip the sep= line
-                csv_content = '\n'.join(csv_lines[1:])
-            else:
-                csv_content = csv_data
-            
-            csv_reader = csv.DictReader(io.StringIO(csv_content), delimiter=';')
+            # Parse CSV data while it is being decoded, one chunk at a time
+            encoding = self._declared_encoding(json_response.get("ContentType"))
+            csv_reader = csv.reader(self._iter_csv_lines(json_response["Data"], encoding), delimiter=';')
             
             # Load schema to identify field types for proper data conversion
             schema = self.get_json_schema()
             schema_properties = schema.get("properties", {})
             
-            for row_index, row in enumerate(csv_reader):
-                # Clean up the row data with proper type conversion
-                cleaned_row = {}
-                for key, value in row.items():
-                    if key and key.strip():
-                        clean_key = key.strip()
-                        cleaned_value = self._convert_field_value(clean_key, value, schema_properties)
-                        # Always include the field, even if null, to maintain schema consistency
-                        cleaned_row[clean_key] = cleaned_value
-                
-                # Create flattened record with metadata and CSV data at top level
-                record = {
-                    # Metadata fields at top level
-                    "_metadata_identifier": metadata["_metadata_identifier"],
-                    "_metadata_timestamp": metadata["_metadata_timestamp"],
-                    "_metadata_file_name": metadata["_metadata_file_name"]
-                }
-                
-                # Add all CSV columns at top level
-                record.update(cleaned_row)
+            record_count = 0
+            try:
+                # Resolve each column's name and converter from the header
+                header = self._read_csv_header(csv_reader)
+                columns = [
+                    (index, name, self._column_converter(name, self._field_type_flags(schema_properties.get(name, {}))))
+                    for index, name in enumerate(header) if name
+                ]
                 
-                yield record
+                for row_index, row in enumerate(csv_reader):
+                    if not row:
+                        continue
+                    
+                    # Create flattened record with metadata and CSV data at top level, converting
+                    # each cell with its column's converter; missing trailing cells become null
+                    # so every record carries every field, maintaining schema consistency
+                    record = metadata.copy()
+                    row_length = len(row)
+                    for index, name, convert in columns:
+                        record[name] = convert(row[index]) if index < row_length else None
+                    
+                    yield record
+                    record_count += 1
+            except binascii.Error as e:
+                if record_count:
+                    # Records were already emitted; stopping quietly would pass off a truncated sync as complete
+                    logging.error(f"Failed to decode base64 data after {record_count} records: {str(e)}")
+                    raise
+                logging.error(f"Failed to decode base64 data: {str(e)}")
+                return
                 
         except Exception as e:
             logging.error(f"Error parsing response: {str(e)}")
             raise
 
+    def _read_data_prefix(self, response: requests.Response, length: int) -> Tuple[Optional[str], Optional[str], bool]:
+        """
+        Read the response body only until `length` characters of the base64 "Data" value are in.
+        
+        Schema discovery needs just the first CSV lines, so this avoids downloading and
+        parsing the whole payload. Base64 contains no quotes or backslashes, so the value
+        ends at the next quote and the only JSON escapes it can hold are \\/ and \\uXXXX.
+        
+        Returns:
+            Tuple of (data prefix or None if there is no "Data" string, declared charset
+            if ContentType was seen before "Data", whether the prefix is the whole value).
+        """
+        body = bytearray()
+        value_start = None
+        for chunk in response.iter_content(chunk_size=self.read_chunk_size):
+            # Only search what is new, plus enough of the previous chunk for a match straddling both
+            search_start = max(0, len(body) - 64)
+            body += chunk
+            if value_start is None:
+                match = _DATA_VALUE_START.search(body, search_start)
+                if not match:
+                    continue
+                value_start = match.end()
+            if body.find(b'"', max(value_start, search_start)) != -1 or len(body) - value_start >= length:
+                break
+        if value_start is None:
+            return None, None, False
+        
+        value_end = body.find(b'"', value_start)
+        complete = value_end != -1
+        raw = body[value_start:value_end] if complete else body[value_start:value_start + length]
+        # Drop an escape sequence cut off at the end of the prefix
+        backslash = raw.rfind(b"\\", max(0, len(raw) - 6))
+        if backslash != -1 and len(raw) - backslash < (6 if raw[backslash + 1:backslash + 2] == b"u" else 2):
+            raw = raw[:backslash]
+        
+        content_type = _CONTENT_TYPE_VALUE.search(body, 0, value_start)
+        encoding = self._declared_encoding(content_type.group(1).decode("utf-8", "replace")) if content_type else None
+        data = orjson.loads(b'"' + raw + b'"')
+        return data, encoding, complete
+
+    def _read_response_body(self, response: requests.Response) -> bytes:
+        """
+        Return the (decompressed) response body, reading it in read_chunk_size chunks.
+        """
+        return b"".join(response.iter_content(chunk_size=self.read_chunk_size))
+
     def get_json_schema(self) -> Mapping[str, Any]:
         """
         Return the JSON schema for this stream.
-        Dynamically discovers CSV columns from the API response.
+        
+        The CDK asks for the schema several times per run (discover, catalog
+        validation, parsing), so it is loaded once and reused.
+        """
+        if self._cached_schema is None:
+            self._cached_schema = self._load_json_schema()
+        return self._cached_schema
+
+    def _load_json_schema(self) -> Mapping[str, Any]:
+        """
+        Load the JSON schema from the schema file.
+        Dynamically discovers CSV columns from the API response if the file is missing.
         """
         schema_path = os.path.join(os.path.dirname(__file__), "schemas", "point_data.json")
         try:
-            with open(schema_path, "r") as f:
-                return json.load(f)
+            return self._read_schema_file(schema_path)
         except FileNotFoundError:
+            # Reuse a schema discovered by a recent run
+            cached_schema = self._read_cached_schema()
+            if cached_schema:
+                return cached_schema
+            
             # Try to discover schema dynamically from API
             try:
                 discovered_schema = self._discover_schema_from_api()
                 if discovered_schema:
+                    self._write_cached_schema(discovered_schema)
                     return discovered_schema
             except Exception as e:
                 logging.warning(f"Failed to discover schema from API: {str(e)}")
@@ -261,6 +352,60 @@ class PointStream(HttpStream):
                 }
             }
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _read_schema_file(schema_path: str) -> Mapping[str, Any]:
+        """
+        Read and parse the bundled schema file.
+        
+        The file is the same for every stream instance, and the source builds a new
+        PointStream for check, discover and read, so it is parsed once per process.
+        """
+        with open(schema_path, "rb") as f:
+            return orjson.loads(f.read())
+
+    def _schema_cache_path(self) -> str:
+        """
+        Return the temp file holding the discovered schema for this organization and distribution type.
+        """
+        key = re.sub(r"[^A-Za-z0-9_.-]", "_", f"{self.organization_id}_{self.distribution_type_id}")
+        return os.path.join(tempfile.gettempdir(), f"point_schema_{key}.json")
+
+    def _read_cached_schema(self) -> Optional[Mapping[str, Any]]:
+        """
+        Return the schema cached by a previous discovery, or None if it is missing or older than schema_cache_ttl.
+        """
+        cache_path = self._schema_cache_path()
+        try:
+            if time.time() - os.path.getmtime(cache_path) > self.schema_cache_ttl:
+                return None
+            with open(cache_path, "rb") as f:
+                return orjson.loads(f.read())
+        except (OSError, ValueError) as e:
+            if not isinstance(e, FileNotFoundError):
+                logging.warning(f"Ignoring unreadable schema cache {cache_path}: {str(e)}")
+            return None
+
+    def _write_cached_schema(self, schema: Mapping[str, Any]) -> None:
+        """
+        Store a discovered schema for later runs.
+        
+        The file is written under a temporary name and moved into place with os.replace,
+        so a concurrent run never reads a partially written schema.
+        """
+        cache_path = self._schema_cache_path()
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(orjson.dumps(schema))
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logging.warning(f"Could not cache discovered schema to {cache_path}: {str(e)}")
+
     def _discover_schema_from_api(self) -> Optional[Mapping[str, Any]]:
         """
         Discover schema by making a test API call and analyzing the CSV structure.
@@ -271,43 +416,25 @@ class PointStream(HttpStream):
             headers = self.request_headers()
             params = self.request_params()
             
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = self._session.get(url, headers=headers, params=params, timeout=30, stream=True)
             
-            if response.status_code != 200:
-                return None
+            try:
+                if response.status_code != 200:
+                    return None
                 
-            json_response = response.json()
-            if "Data" not in json_response:
+                # Only the header and first row are needed, so stop downloading once enough of "Data" arrived
+                data, encoding, complete = self._read_data_prefix(response, self.decode_chunk_size)
+            finally:
+                # Drop the connection instead of downloading the rest of the payload
+                response.close()
+            if data is None:
                 return None
             
-            # Decode base64 data
-            csv_bytes = base64.b64decode(json_response["Data"])
-            
-            # Try different encodings
-            encodings = ['utf-8', 'windows-1252', 'iso-8859-1', 'cp1252']
-            csv_data = None
-            
-            for encoding in encodings:
-                try:
-                    csv_data = csv_bytes.decode(encoding)
-                    break
-                except UnicodeDecodeError:
-                    continue
-            
-            if csv_data is None:
-                return None
-            
-            # Parse CSV to get column names
-            csv_lines = csv_data.strip().split('\n')
-            if csv_lines and csv_lines[0].startswith('sep='):
-                csv_content = '\n'.join(csv_lines[1:])
-            else:
-                csv_content = csv_data
-            
-            csv_reader = csv.DictReader(io.StringIO(csv_content), delimiter=';')
+            csv_reader = csv.reader(self._iter_csv_lines(data, encoding, partial=not complete), delimiter=';')
+            header = self._read_csv_header(csv_reader)
             
             # Get the first row to determine column names and types
-            first_row = next(csv_reader, None)
+            first_row = next((row for row in csv_reader if row), None)
             if not first_row:
                 return None
             
@@ -330,10 +457,10 @@ class PointStream(HttpStream):
             }
             
             # Add CSV columns
-            for column_name, value in first_row.items():
-                if column_name and column_name.strip():
-                    clean_name = column_name.strip()
+            for index, clean_name in enumerate(header):
+                if clean_name:
                     # Try to infer type from the value
+                    value = first_row[index] if index < len(first_row) else None
                     column_type = self._infer_column_type(value)
                     properties[clean_name] = {
                         "type": column_type,
@@ -350,7 +477,84 @@ class PointStream(HttpStream):
             logging.error(f"Error discovering schema from API: {str(e)}")
             return None
 
-    def _infer_column_type(self, value: str) -> List[str]:
+    def _read_csv_header(self, csv_reader: Iterator[List[str]]) -> List[str]:
+        """
+        Read the CSV header row and return its stripped column names.
+        
+        Columns without a name are kept as empty strings so positions still line up
+        with the data rows; callers skip them. Names are interned so every record,
+        schema property and downstream lookup shares one string object per column.
+        """
+        return [sys.intern(name.strip()) if name else "" for name in next(csv_reader, [])]
+
+    def _declared_encoding(self, content_type: Optional[str]) -> Optional[str]:
+        """
+        Return the charset declared in the response's ContentType, if it is a known codec.
+        """
+        if not content_type:
+            return None
+        for parameter in content_type.split(";")[1:]:
+            key, _, value = parameter.partition("=")
+            if key.strip().lower() == "charset":
+                try:
+                    return codecs.lookup(value.strip().strip('"')).name
+                except LookupError:
+                    logging.warning(f"Ignoring unknown charset in ContentType '{content_type}'")
+        return None
+
+    def _iter_csv_lines(self, data: str, encoding: Optional[str] = None, partial: bool = False) -> Iterator[str]:
+        """
+        Decode the base64 "Data" payload slice by slice and yield its CSV text line by line.
+        
+        Args:
+            data: Base64 payload; whitespace is ignored and a leading "sep=" line is skipped
+            encoding: Declared text encoding; None or UTF-8 means UTF-8 falling back to windows-1252
+            partial: If True, data is only the start of the payload; a trailing incomplete
+                group or character is left undecoded and the cut-off last line is not yielded
+            
+        Raises:
+            binascii.Error: If the payload is not valid base64
+        """
+        # A declared UTF-8 charset is not always accurate, so it keeps the windows-1252 fallback
+        if encoding and encoding != "utf-8":
+            decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        else:
+            decoder = codecs.getincrementaldecoder("utf-8")()
+        pending = ""
+        first_line = True
+        carry = ""
+        
+        for start in range(0, len(data) + 1, self.decode_chunk_size):
+            final = start + self.decode_chunk_size > len(data)
+            # Without whitespace the slice may not end on a 4-character group; the
+            # incomplete group is carried over and decoded with the next slice
+            piece = carry + _BASE64_WHITESPACE.sub("", data[start:start + self.decode_chunk_size])
+            if not final or partial:
+                usable = len(piece) // 4 * 4
+                piece, carry = piece[:usable], piece[usable:]
+            chunk = b64decode(piece, validate=True)
+            buffered, _ = decoder.getstate()
+            try:
+                text = decoder.decode(chunk, final and not partial)
+            except UnicodeDecodeError:
+                logging.info("CSV data is not valid UTF-8, decoding the remainder as windows-1252")
+                decoder = codecs.getincrementaldecoder("windows-1252")(errors="replace")
+                text = decoder.decode(buffered + chunk, final and not partial)
+            
+            *lines, pending = (pending + text).split("\n")
+            if first_line and lines:
+                first_line = False
+                if lines[0].startswith("sep="):
+                    del lines[0]
+            for line in lines:
+                # Keep the line ending so quoted values spanning lines stay intact
+                yield line + "\n"
+        
+        if pending and not partial and not (first_line and pending.startswith("sep=")):
+            yield pending
+
+    @staticmethod
+    def _infer_column_type(value: str) -> List[str]:
         """
         Infer the JSON schema type from a CSV value.
         """
@@ -380,95 +584,97 @@ class PointStream(HttpStream):
         # Default to string
         return ["string", "null"]
 
-    def _convert_field_value(self, field_name: str, value: Any, schema_properties: Mapping[str, Any]) -> Any:
+    def _field_type_flags(self, field_schema: Mapping[str, Any]) -> Tuple[bool, bool, bool, bool]:
         """
-        Convert field value based on schema type definition.
+        Summarize a field's schema type for value conversion.
         
         Args:
-            field_name: Name of the field
-            value: Raw value from CSV
-            schema_properties: Schema properties for type checking
+            field_schema: Schema definition of the field
             
         Returns:
-            Converted value or None for empty values that should be null
+            Tuple of (is_integer, is_number, is_boolean, allows_null)
         """
-        # Handle None or empty values
-        if value is None:
-            return None
-            
-        # Convert to string and strip whitespace
-        if isinstance(value, str):
-            value = value.strip()
-        else:
-            value = str(value).strip()
-        
-        # Handle empty strings
-        if value == "":
-            return None
-            
-        # Get field schema definition
-        field_schema = schema_properties.get(field_name, {})
         field_types = field_schema.get("type", ["string", "null"])
         
         # Ensure field_types is a list
         if isinstance(field_types, str):
             field_types = [field_types]
             
-        # If field can be integer, try to convert
-        if "integer" in field_types:
-            try:
-                # Try to convert to integer
-                return int(value)
-            except (ValueError, TypeError):
-                # If conversion fails and null is allowed, return None
-                if "null" in field_types:
-                    logging.warning(f"Could not convert '{value}' to integer for field '{field_name}', setting to null")
-                    return None
-                else:
-                    # If null not allowed, keep as string
-                    logging.warning(f"Could not convert '{value}' to integer for field '{field_name}', keeping as string")
-                    return value
+        return ("integer" in field_types, "number" in field_types, "boolean" in field_types, "null" in field_types)
+
+    def _column_converter(self, field_name: str, type_flags: Tuple[bool, bool, bool, bool]) -> Callable[[Optional[str]], Any]:
+        """
+        Build a converter for one CSV column, specialized to its schema type.
         
-        # If field can be number (float), try to convert
-        elif "number" in field_types:
-            try:
-                # Try to convert to float
-                return float(value)
-            except (ValueError, TypeError):
-                # If conversion fails and null is allowed, return None
-                if "null" in field_types:
-                    logging.warning(f"Could not convert '{value}' to number for field '{field_name}', setting to null")
+        Resolving the type once per column keeps the per-cell work down to a strip,
+        an emptiness check and the actual conversion.
+        
+        Args:
+            field_name: Name of the field, used in warnings
+            type_flags: Tuple of (is_integer, is_number, is_boolean, allows_null)
+            
+        Returns:
+            Function converting a raw CSV string (or None) to the field's value,
+            with None for empty values that should be null
+        """
+        is_integer, is_number, is_boolean, allows_null = type_flags
+        
+        if is_integer:
+            parse, target_type = int, "integer"
+        elif is_number:
+            parse, target_type = float, "number"
+        elif is_boolean:
+            parse, target_type = self._parse_boolean, "boolean"
+        else:
+            # For string fields or any other type, return the cleaned string value
+            def convert_string(value: Optional[str]) -> Optional[str]:
+                if value is None:
                     return None
-                else:
-                    # If null not allowed, keep as string
-                    logging.warning(f"Could not convert '{value}' to number for field '{field_name}', keeping as string")
-                    return value
+                return value.strip() or None
+            return convert_string
+        
+        # If conversion fails, return None when null is allowed, otherwise keep the string
+        outcome = "setting to null" if allows_null else "keeping as string"
         
-        # If field can be boolean, try to convert
-        elif "boolean" in field_types:
+        def convert(value: Optional[str]) -> Any:
+            if value is None:
+                return None
+            value = value.strip()
+            if not value:
+                return None
             try:
-                # Convert common boolean representations
-                lower_value = value.lower()
-                if lower_value in ["true", "yes", "1", "on", "enabled"]:
-                    return True
-                elif lower_value in ["false", "no", "0", "off", "disabled"]:
-                    return False
-                else:
-                    # If conversion fails and null is allowed, return None
-                    if "null" in field_types:
-                        logging.warning(f"Could not convert '{value}' to boolean for field '{field_name}', setting to null")
-                        return None
-                    else:
-                        # If null not allowed, keep as string
-                        return value
-            except (ValueError, TypeError):
-                if "null" in field_types:
-                    return None
-                else:
-                    return value
+                return parse(value)
+            except ValueError:
+                self._warn_conversion_failure(field_name, value, target_type, outcome)
+                return None if allows_null else value
         
-        # For string fields or any other type, return the cleaned string value
-        return value
+        return convert
+
+    def _parse_boolean(self, value: str) -> bool:
+        """
+        Convert common boolean representations, raising ValueError for anything else.
+        """
+        lower_value = value.lower()
+        if lower_value in _TRUE:
+            return True
+        if lower_value in _FALSE:
+            return False
+        raise ValueError(f"Not a boolean: {value}")
+
+    def _warn_conversion_failure(self, field_name: str, value: str, target_type: str, outcome: str) -> None:
+        """
+        Log a failed value conversion once per field and type.
+        
+        A column whose data does not match its schema fails on every row; logging each
+        cell would dominate the sync time and flood the logs.
+        """
+        if (field_name, target_type) in self._conversion_warnings:
+            return
+        self._conversion_warnings.add((field_name, target_type))
+        logging.warning(
+            f"Could not convert '{value}' to {target_type} for field '{field_name}', {outcome} "
+            f"(further failures for this field are not logged)"
+        )
 
     def test_connection(self) -> bool:
         """
@@ -483,14 +689,18 @@ class PointStream(HttpStream):
             headers = self.request_headers()
             params = self.request_params()
             
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = self._session.get(url, headers=headers, params=params, timeout=30, stream=True)
             
             # Check if request was successful
             if response.status_code == 200:
                 # Try to parse the response to ensure it's valid
-                json_response = response.json()
+                json_response = orjson.loads(self._read_response_body(response))
                 if "Data" in json_response:
                     return True
+                
+                # The streamed body has been consumed, so report what was missing instead
+                logging.error("API test failed with status 200: response has no 'Data' field")
+                return False
                     
             logging.error(f"API test failed with status {response.status_code}: {response.text}")
             return False
@@ -0,0 +1,64 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import io
+import logging
+import pytest
+from unittest.mock import Mock, patch
+from source_point.run import MESSAGE_BATCH_SIZE, launch
+
+
+class TestLaunch:
+    """Test cases for the batched launch entry point."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.stdout = io.StringIO()
+        self.stdout.flush = Mock()
+
+    def _launch(self, messages):
+        """Run launch with the entrypoint yielding the given messages, writing to self.stdout."""
+        with patch('source_point.run.AirbyteEntrypoint') as mock_entrypoint, patch('sys.stdout', self.stdout):
+            mock_entrypoint.return_value.run.return_value = messages
+            launch(Mock(), ["read"])
+
+    def test_launch_writes_batches(self):
+        """Test that messages are written in order, one full batch per flush."""
+        messages = [f"message {i}" for i in range(2 * MESSAGE_BATCH_SIZE + 5)]
+
+        self._launch(iter(messages))
+
+        assert self.stdout.getvalue().splitlines() == messages
+        # Two full batches plus the remainder at the end
+        assert self.stdout.flush.call_count == 3
+
+    def test_launch_flushes_when_run_raises(self):
+        """Test that messages buffered before an error are still written."""
+        def messages():
+            yield "message 0"
+            yield "message 1"
+            raise RuntimeError("sync failed")
+
+        with pytest.raises(RuntimeError):
+            self._launch(messages())
+
+        assert self.stdout.getvalue().splitlines() == ["message 0", "message 1"]
+
+    def test_launch_flushes_before_log_output(self):
+        """Test that buffered messages are written before a log line that follows them."""
+        handler = logging.StreamHandler(self.stdout)
+        logging.getLogger().addHandler(handler)
+
+        def messages():
+            yield "message 0"
+            logging.getLogger().warning("log line")
+            yield "message 1"
+
+        try:
+            self._launch(messages())
+        finally:
+            logging.getLogger().removeHandler(handler)
+
+        assert self.stdout.getvalue().splitlines() == ["message 0", "log line", "message 1"]
+        assert not handler.filters
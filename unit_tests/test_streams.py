@@ -3,12 +3,32 @@
 #
 
 import base64
+import binascii
 import json
 from unittest.mock import Mock, patch
 import pytest
 import requests
 from source_point.streams import PointStream
 
+GET_LATEST_URL = f"{PointStream.url_base}GetLatest"
+
+# Base64-encoded CSV payloads shared by the tests, encoded once at import
+CSV_DATA_B64 = base64.b64encode(b"column1;column2;column3\nvalue1;value2;value3\nvalue4;value5;value6").decode('utf-8')
+SMALL_CSV_DATA_B64 = base64.b64encode(b"col1;col2\nval1;val2").decode('utf-8')
+
+
+def _mock_response(payload, chunk_size=None):
+    """Build a mock API response streaming the payload in chunks of chunk_size (whole by default).
+
+    The payload is JSON-encoded unless it is already the raw body bytes.
+    """
+    body = payload if isinstance(payload, bytes) else json.dumps(payload).encode('utf-8')
+    chunk_size = chunk_size or max(len(body), 1)
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.iter_content.return_value = iter([body[i:i + chunk_size] for i in range(0, len(body), chunk_size)])
+    return mock_response
+
 
 class TestPointStream:
     """Test cases for PointStream class."""
@@ -34,17 +54,16 @@ class TestPointStream:
         """Test request headers are correctly formatted."""
         headers = self.stream.request_headers()
         
-        assert "APIkey" in headers
-        assert headers["APIkey"] == "test_api_key"
-        assert headers["Accept"] == "application/json"
+        assert headers.get("APIkey") == "test_api_key"
+        assert headers.get("Accept") == "application/json"
         assert "User-Agent" in headers
 
     def test_request_params(self):
         """Test request parameters are correctly formatted."""
         params = self.stream.request_params()
         
-        assert params["OrganizationID"] == "test_org_id"
-        assert params["DistributionTypeID"] == "1"
+        assert params.get("OrganizationID") == "test_org_id"
+        assert params.get("DistributionTypeID") == "1"
         # APIkey is now in headers only, not in params
         assert "APIkey" not in params
 
@@ -67,35 +86,130 @@ class TestPointStream:
         assert "properties" in schema
         
         properties = schema["properties"]
-        assert "_metadata_identifier" in properties  # Metadata field
-        assert "_metadata_timestamp" in properties   # Metadata field
-        assert "_metadata_file_name" in properties   # Metadata field
-        assert "TransferID" in properties           # Primary key field
-        assert "TransferCreatedDate" in properties  # Cursor field
+        # Metadata fields, primary key field and cursor field
+        assert properties.keys() >= {
+            "_metadata_identifier", "_metadata_timestamp", "_metadata_file_name", "TransferID", "TransferCreatedDate"
+        }
         # Check that primary key is properly defined
         assert properties["TransferID"]["description"] == "CSV column: TransferID (Primary Key)"
         assert properties["TransferCreatedDate"]["description"] == "CSV column: TransferCreatedDate (Cursor Field)"
         assert "metadata" not in properties
         assert "data" not in properties
 
+    @patch('source_point.streams.PointStream._load_json_schema')
+    def test_get_json_schema_cached(self, mock_load_json_schema):
+        """Test that the schema is only loaded once per stream."""
+        mock_load_json_schema.return_value = {"type": "object", "properties": {}}
+
+        assert self.stream.get_json_schema() is self.stream.get_json_schema()
+        mock_load_json_schema.assert_called_once()
+
+    def test_get_json_schema_file_shared(self):
+        """Test that the bundled schema file is parsed once for all stream instances."""
+        assert PointStream(config=self.config).get_json_schema() is self.stream.get_json_schema()
+
+    def test_discovered_schema_cache(self, tmp_path):
+        """Test that a discovered schema is cached on disk until it expires."""
+        schema = {"type": "object", "properties": {"TransferID": {"type": ["integer", "null"]}}}
+
+        with patch('tempfile.gettempdir', return_value=str(tmp_path)):
+            assert self.stream._read_cached_schema() is None
+            self.stream._write_cached_schema(schema)
+            assert self.stream._read_cached_schema() == schema
+            assert PointStream(config={**self.config, "organization_id": "other_org"})._read_cached_schema() is None
+
+            self.stream.schema_cache_ttl = -1
+            assert self.stream._read_cached_schema() is None
+
+    @patch('requests.Session.get')
+    def test_discover_schema_from_api(self, mock_get):
+        """Test that schema discovery infers column types from the first row."""
+        csv_data = "sep=;\nTransferID; ClientName ;;Score\n42;Jan;x;1.5\n43;Piet;y;2"
+        encoded_data = base64.b64encode(csv_data.encode('utf-8')).decode('utf-8')
+
+        mock_response = _mock_response({"Identifier": "test-id", "Data": encoded_data})
+        mock_get.return_value = mock_response
+
+        schema = self.stream._discover_schema_from_api()
+
+        properties = schema["properties"]
+        assert "_metadata_identifier" in properties
+        assert properties["TransferID"]["type"] == ["integer", "null"]
+        assert properties["ClientName"]["type"] == ["string", "null"]
+        assert properties["Score"]["type"] == ["number", "null"]
+        assert "" not in properties
+
+    @patch('requests.Session.get')
+    def test_discover_schema_from_api_error_status(self, mock_get):
+        """Test that schema discovery releases the connection of a failed request."""
+        mock_response = _mock_response({})
+        mock_response.status_code = 500
+        mock_get.return_value = mock_response
+
+        assert self.stream._discover_schema_from_api() is None
+        mock_response.close.assert_called_once()
+
+    @patch('requests.Session.get')
+    def test_discover_schema_from_api_reads_data_prefix(self, mock_get):
+        """Test that schema discovery stops reading once the first rows of Data are in."""
+        csv_data = "TransferID;Remark\n42;ok?>\n" + "43;long row\n" * 1000
+        encoded_data = base64.b64encode(csv_data.encode('utf-8')).decode('utf-8')
+        body = json.dumps({"Identifier": "test-id", "Data": encoded_data}).replace("/", "\\/").encode('utf-8')
+
+        mock_response = _mock_response(body, chunk_size=64)
+        mock_get.return_value = mock_response
+
+        self.stream.decode_chunk_size = 64
+        schema = self.stream._discover_schema_from_api()
+
+        assert schema["properties"]["TransferID"]["type"] == ["integer", "null"]
+        assert schema["properties"]["Remark"]["type"] == ["string", "null"]
+        assert next(mock_response.iter_content.return_value, None) is not None  # rest of the body left unread
+        mock_response.close.assert_called_once()
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 64])
+    def test_read_data_prefix_across_chunks(self, chunk_size):
+        """Test that the Data value is found when its key is split over several chunks."""
+        body = json.dumps({"Identifier": "test-id", "ContentType": "text/csv; charset=utf-8", "Data": "QUJD"}).encode('utf-8')
+        null_body = json.dumps({"Identifier": "test-id", "Data": None, "Padding": "x" * 1000}).encode('utf-8')
+
+        assert self.stream._read_data_prefix(_mock_response(body, chunk_size), 64) == ("QUJD", "utf-8", True)
+        assert self.stream._read_data_prefix(_mock_response(null_body, chunk_size), 64) == (None, None, False)
+
+    @patch('requests.Session.get')
+    def test_discover_schema_from_api_escaped_prefix(self, mock_get):
+        """Test that a data prefix ending inside a multibyte character keeps the UTF-8 header intact."""
+        # "???" encodes to "Pz8/", so escaped slashes make the unescaped prefix shorter than it was read
+        csv_data = "Vraag???;Cliënt\n" + "Ja;Zoë\n" * 50
+        encoded_data = base64.b64encode(csv_data.encode('utf-8')).decode('utf-8')
+        body = json.dumps({"Identifier": "test-id", "Data": encoded_data}).replace("/", "\\/").encode('utf-8')
+
+        discovered = 0
+        # Try prefix lengths that end at every position within the first rows
+        for prefix_length in range(24, 120):
+            mock_get.return_value = _mock_response(body, chunk_size=16)
+            self.stream.decode_chunk_size = prefix_length
+
+            schema = self.stream._discover_schema_from_api()
+
+            if schema is not None:
+                discovered += 1
+                assert "Cliënt" in schema["properties"]
+                assert "Vraag???" in schema["properties"]
+        assert discovered > 0
+
     def test_parse_response_success(self):
         """Test successful response parsing."""
-        # Create test CSV data
-        csv_data = "column1;column2;column3\nvalue1;value2;value3\nvalue4;value5;value6"
-        encoded_data = base64.b64encode(csv_data.encode('utf-8')).decode('utf-8')
-        
         # Mock API response - updated to match actual API structure
         mock_response_data = {
             "Identifier": "test-id-123",
             "FileName": "test.csv",
             "ContentType": "text/csv",
             "Timestamp": "2023-01-01T12:00:00Z",
-            "Data": encoded_data
+            "Data": CSV_DATA_B64
         }
         
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_response_data
+        mock_response = _mock_response(mock_response_data)
         
         # Parse response
         records = list(self.stream.parse_response(mock_response))
@@ -119,85 +233,141 @@ class TestPointStream:
         assert second_record["column2"] == "value5"        # CSV data flattened
         assert second_record["column3"] == "value6"        # CSV data flattened
 
-    def test_parse_response_missing_body(self):
-        """Test response parsing with missing body."""
-        mock_response_data = {}  # Empty response
-        
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_response_data
-        
+    def test_parse_response_chunked_decode(self):
+        """Test parsing when the payload is decoded over several chunks."""
+        csv_data = "sep=;\nTransferID;ClientName\n1;Zoë\n2;\"Multi\nline\"\n"
+        encoded_data = base64.b64encode(csv_data.encode('windows-1252')).decode('utf-8')
+
+        mock_response = _mock_response({"Identifier": "test-id-123", "Data": encoded_data})
+
+        # Force several small chunks so rows and characters straddle chunk boundaries
+        self.stream.decode_chunk_size = 8
         records = list(self.stream.parse_response(mock_response))
-        assert len(records) == 0
 
-    def test_parse_response_missing_data(self):
-        """Test response parsing with missing Data field."""
-        mock_response_data = {
+        assert len(records) == 2
+        assert records[0]["TransferID"] == 1
+        assert records[0]["ClientName"] == "Zoë"
+        assert records[1]["ClientName"] == "Multi\nline"
+
+    def test_parse_response_wrapped_base64(self):
+        """Test parsing a payload whose base64 is wrapped over lines of 76 characters."""
+        csv_data = "TransferID;ClientName\n" + "".join(f"{i};Client {i}\n" for i in range(2000))
+        encoded_data = base64.encodebytes(csv_data.encode('utf-8')).decode('utf-8')
+
+        mock_response = _mock_response({"Identifier": "test-id-123", "Data": encoded_data})
+
+        # Slices that do not line up with the wrapped lines or with 4-character groups
+        self.stream.decode_chunk_size = 50
+        records = list(self.stream.parse_response(mock_response))
+
+        assert len(records) == 2000
+        assert records[-1]["ClientName"] == "Client 1999"
+
+    def test_parse_response_declared_charset(self):
+        """Test that a charset declared in ContentType is used to decode the CSV."""
+        csv_data = "TransferID;ClientName\n1;Zoë"
+        encoded_data = base64.b64encode(csv_data.encode('iso-8859-15')).decode('utf-8')
+
+        mock_response = _mock_response({
             "Identifier": "test-id-123",
-            "FileName": "test.csv"
-            # Missing "Data" field
-        }
-        
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_response_data
-        
+            "ContentType": "text/csv; charset=ISO-8859-15",
+            "Data": encoded_data
+        })
+
         records = list(self.stream.parse_response(mock_response))
-        assert len(records) == 0
 
-    def test_parse_response_invalid_base64(self):
-        """Test response parsing with invalid base64 data."""
-        mock_response_data = {
+        assert records[0]["ClientName"] == "Zoë"
+
+    def test_parse_response_mislabelled_charset(self):
+        """Test that a payload declared as UTF-8 but encoded as windows-1252 still decodes."""
+        csv_data = "TransferID;ClientName\n1;Zoë"
+        encoded_data = base64.b64encode(csv_data.encode('windows-1252')).decode('utf-8')
+
+        mock_response = _mock_response({
             "Identifier": "test-id-123",
-            "FileName": "test.csv",
-            "ContentType": "text/csv",
-            "Timestamp": "2023-01-01T12:00:00Z",
-            "Data": "invalid_base64_data!!!"
-        }
-        
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_response_data
+            "ContentType": "text/csv; charset=utf-8",
+            "Data": encoded_data
+        })
+
+        records = list(self.stream.parse_response(mock_response))
+
+        assert records[0]["ClientName"] == "Zoë"
+
+    def test_parse_response_conversion_failure_logged_once(self, caplog):
+        """Test that a column failing conversion on every row only logs one warning."""
+        csv_data = "TransferID;ClientBirthYear\n1;unknown\n2;unknown\n3;1950"
+        encoded_data = base64.b64encode(csv_data.encode('utf-8')).decode('utf-8')
+
+        mock_response = _mock_response({"Identifier": "test-id-123", "Data": encoded_data})
+
+        records = list(self.stream.parse_response(mock_response))
+
+        assert [record["ClientBirthYear"] for record in records] == [None, None, 1950]
+        assert len([r for r in caplog.records if "ClientBirthYear" in r.getMessage()]) == 1
+
+    def test_parse_response_invalid_base64_after_records(self):
+        """Test that corrupt base64 after records were emitted fails instead of ending early."""
+        csv_data = "TransferID;ClientName\n" + "".join(f"{i};Client {i}\n" for i in range(200))
+        encoded_data = base64.b64encode(csv_data.encode('utf-8')).decode('utf-8')
+        encoded_data = encoded_data[:2000] + "!" + encoded_data[2001:]
+
+        mock_response = _mock_response({"Identifier": "test-id-123", "Data": encoded_data})
+
+        self.stream.decode_chunk_size = 400
+        records = []
+        with pytest.raises(binascii.Error):
+            for record in self.stream.parse_response(mock_response):
+                records.append(record)
+        assert 0 < len(records) < 200
+
+    @pytest.mark.parametrize(
+        "mock_response_data",
+        [
+            {},  # Empty response
+            {"Identifier": "test-id-123", "FileName": "test.csv"},  # Missing "Data" field
+            {
+                "Identifier": "test-id-123",
+                "FileName": "test.csv",
+                "ContentType": "text/csv",
+                "Timestamp": "2023-01-01T12:00:00Z",
+                "Data": "invalid_base64_data!!!"
+            },
+            {"Identifier": "test-id-123", "Data": None},
+        ],
+        ids=["missing_body", "missing_data", "invalid_base64", "null_data"],
+    )
+    def test_parse_response_without_records(self, mock_response_data):
+        """Test response parsing with missing body, missing Data field, non-string Data or invalid base64 data."""
+        mock_response = _mock_response(mock_response_data)
         
         records = list(self.stream.parse_response(mock_response))
         assert len(records) == 0
 
-    @patch('requests.get')
-    def test_test_connection_success(self, mock_get):
+    def test_test_connection_success(self, requests_mock):
         """Test successful connection test."""
         # Mock successful response
-        csv_data = "col1;col2\nval1;val2"
-        encoded_data = base64.b64encode(csv_data.encode('utf-8')).decode('utf-8')
-        
         mock_response_data = {
             "Identifier": "test-id",
             "FileName": "test.csv",
-            "Data": encoded_data
+            "Data": SMALL_CSV_DATA_B64
         }
         
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_response_data
-        mock_get.return_value = mock_response
+        requests_mock.get(GET_LATEST_URL, json=mock_response_data)
         
         result = self.stream.test_connection()
         assert result is True
+        assert requests_mock.last_request.qs["organizationid"] == ["test_org_id"]
 
-    @patch('requests.get')
-    def test_test_connection_failure(self, mock_get):
+    def test_test_connection_failure(self, requests_mock):
         """Test failed connection test."""
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_response.text = "Unauthorized"
-        mock_get.return_value = mock_response
+        requests_mock.get(GET_LATEST_URL, status_code=401, text="Unauthorized")
         
         result = self.stream.test_connection()
         assert result is False
 
-    @patch('requests.get')
-    def test_test_connection_exception(self, mock_get):
+    def test_test_connection_exception(self, requests_mock):
         """Test connection test with exception."""
-        mock_get.side_effect = requests.RequestException("Network error")
+        requests_mock.get(GET_LATEST_URL, exc=requests.ConnectionError("Network error"))
         
         result = self.stream.test_connection()
-        assert result is False
\ No newline at end of file
+        assert result is False